@@ -1,5 +1,4 @@
 # Stdlib. imports
-from copy import deepcopy
 import logging
 
 # 3rd party imports
@@ -19,48 +18,64 @@ logger.addHandler(stream_handler)
 # logger.setLevel(logging.DEBUG)
 logger.setLevel(logging.INFO)
 
+# Use default neural network hyper-parameters, 500 learning epochs
+HYPERPARAMS = default_config()
+HYPERPARAMS['epochs'] = 500
+
+# RMSE of previously-evaluated descriptor subsets (per process)
+RMSE_CACHE = {}
+
 
 def evaluate_input_vars(var_indices, df):
 
+    # Duplicate/reordered indices select the same descriptor subset; only
+    #   train once per unique subset
+    subset = tuple(sorted(set(var_indices)))
+    if subset in RMSE_CACHE:
+        return RMSE_CACHE[subset]
+
     # Convert descriptor indices to names
-    input_names = [df._input_names[i] for i in var_indices]
-    logger.debug('Input descriptor names: {}'.format(input_names))
+    all_names = df._input_names[:]
+    input_names = [all_names[i] for i in subset]
+    logger.debug('Input descriptor names: %s', input_names)
 
-    # Set the dataset to selected names
-    df = deepcopy(df)
+    # Set the dataset to selected names; restored afterwards instead of
+    #   copying the entire dataset for every evaluation
     df.set_inputs(input_names)
 
-    # Use default neural network hyper-parameters, 500 learning epochs
-    hyperparams = default_config()
-    hyperparams['epochs'] = 500
-
     # Train a neural network, return RMSE of predictions
-    rmse = train_model(df.package_sets(), hyperparams, None, 'rmse',
-                       validate=False, save=False)
-    logger.debug('RMSE: {}'.format(rmse))
+    try:
+        rmse = train_model(df.package_sets(), HYPERPARAMS, None, 'rmse',
+                           validate=False, save=False)
+    finally:
+        df.set_inputs(all_names)
+    logger.debug('RMSE: %s', rmse)
+    RMSE_CACHE[subset] = rmse
     return rmse
 
 
 def log_best(pop):
 
-    logger.info('Best RMSE: {}'.format(pop.best_ret_val))
-    logger.info('Average RMSE: {}'.format(pop.average_ret_val))
+    logger.info('Best RMSE: %s', pop.best_ret_val)
+    logger.info('Average RMSE: %s', pop.average_ret_val)
 
 
 def main(database, pop_size, num_desc, num_generations):
 
     # Import cetane number database, 5305 descriptors from alvaDesc
     df = DataFrame(database)
-    logger.info('Loaded data from {}'.format(database))
+    logger.info('Loaded data from %s', database)
 
     # Search space equal to the number of descriptors
     num_input_vars = len(df._input_names)
 
-    # Initialize the population with specified population members
-    population = Population(pop_size, evaluate_input_vars, {'df': df}, 8)
+    # Initialize the population with specified population members, cache
+    #   objective function return values for repeated parameter values
+    population = Population(pop_size, evaluate_input_vars, {'df': df}, 8,
+                            cache=True)
 
     # Add integer values (indices of search space) to optimize
-    logger.info('Optimizing training using {} descriptors'.format(num_desc))
+    logger.info('Optimizing training using %s descriptors', num_desc)
     for _ in range(num_desc):
         population.add_param(0, num_input_vars - 1)
 
@@ -71,10 +86,13 @@ def main(database, pop_size, num_desc, num_generations):
 
     # Run the population for specified number of generations
     for i in range(num_generations):
-        logger.info('Generation {}...'.format(i + 1))
+        logger.info('Generation %s...', i + 1)
         population.next_generation(0.5, 0.1)
         log_best(population)
 
+    # Shut down the population's worker processes
+    population.close()
+
 
 if __name__ == '__main__':
 
@@ -3,6 +3,8 @@ from typing import Union
 
 class Member:
 
+    __slots__ = ('_params', '_obj_fn_val', '_fitness_score')
+
     def __init__(self, params: list, obj_fn_val: Union[int, float]):
         ''' Member object: houses information about a population member's
         currently-used parameters, the return value of the objective function
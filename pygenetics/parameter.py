@@ -1,11 +1,11 @@
-from random import uniform
+from random import Random, random
 from typing import Union
 
 
 class Parameter:
 
     def __init__(self, min_val: Union[int, float], max_val: Union[int, float],
-                 restrict: bool = True):
+                 restrict: bool = True, rng: Random = None):
         ''' Parameter object: houses information about a user-supplied
         parameter including data type, minimum/maximum initialization values,
         and whether the parameter is limited to [min_val, max_val] when
@@ -18,6 +18,9 @@ class Parameter:
                 initialization
             restrict (bool): if `True`, parameter mutations must be within
                 [min_val, max_val]
+            rng (random.Random): random number generator used for sampling
+                and mutation; if `None`, the `random` module's shared
+                generator is used
         '''
 
         if type(min_val) != type(max_val):
@@ -32,8 +35,13 @@ class Parameter:
 
         self._min_val = min_val
         self._max_val = max_val
+        self._range = max_val - min_val
         self._dtype = type(min_val)
         self._restrict = restrict
+        # int parameters spanning <= 2 values may not be able to mutate to a
+        #   new value; mutate() accepts an unchanged value for these
+        self._small_int_range = self._dtype is int and self._range <= 2
+        self._random = random if rng is None else rng.random
 
     @property
     def rand_val(self) -> Union[int, float]:
@@ -43,8 +51,25 @@ class Parameter:
         X = min_val + rand(0, 1) * (max_val - min_val)
         '''
 
-        return self._dtype(self._min_val + uniform(0, 1) *
-                           (self._max_val - self._min_val))
+        return self._dtype(self._min_val + self._random() * self._range)
+
+    def rand_vals(self, num_vals: int) -> list:
+        ''' Parameter.rand_vals: generates `num_vals` random values in range
+        [min_val, max_val] using the same equation as Parameter.rand_val;
+        attribute lookups are performed once for all values
+
+        Args:
+            num_vals (int): number of values to generate
+
+        Returns:
+            list: random parameter values
+        '''
+
+        min_val = self._min_val
+        val_range = self._range
+        dtype = self._dtype
+        rand = self._random
+        return [dtype(min_val + rand() * val_range) for _ in range(num_vals)]
 
     def mutate(self, curr_value: Union[int, float]) -> Union[int, float]:
         ''' Parameter.mutate: mutates current parameter value by using the
@@ -62,20 +87,15 @@ class Parameter:
             int, float: mutated parameter value
         '''
 
+        scale = 2 * self._random() - 1
         new_value = self._dtype(
-            curr_value + uniform(-1, 1) * (curr_value - self.rand_val)
+            curr_value + scale * (curr_value - self.rand_val)
         )
 
         if self._restrict:
-            if new_value > self._max_val:
-                new_value = self._max_val
-            elif new_value < self._min_val:
-                new_value = self._min_val
-
-        if new_value == curr_value:
-            if self._dtype is int and self._max_val - self._min_val <= 2:
-                pass
-            else:
-                return self.mutate(curr_value)
+            new_value = min(max(new_value, self._min_val), self._max_val)
+
+        if new_value == curr_value and not self._small_int_range:
+            return self.mutate(curr_value)
 
         return new_value
@@ -1,20 +1,31 @@
-from bisect import bisect
-from multiprocessing import Pool
-from random import random, uniform
+from collections import deque
+from heapq import nlargest, nsmallest
+from math import ceil
+from multiprocessing import get_context
+from multiprocessing.pool import Pool
+from operator import attrgetter
+from random import Random
 from typing import Callable, Union
 from warnings import warn
+from weakref import finalize
 
 from pygenetics.member import Member
 from pygenetics.parameter import Parameter
-from pygenetics.utils import calc_cdf_vals, call_obj_fn,\
-    determine_best_member, mutate_params, perform_crossover
+from pygenetics.utils import bind_obj_fn, calc_cdf_vals, call_batch_obj_fn,\
+    call_worker_obj_fn, determine_best_member, init_worker, mutate_params,\
+    perform_crossover, select_mate, tournament_select,\
+    tournament_select_mate
 
 
 class Population:
 
     def __init__(self, pop_size: int,
                  objective_fn: Callable[[list], Union[int, float]],
-                 obj_fn_args: dict = {}, num_processes: int = 1):
+                 obj_fn_args: dict = {}, num_processes: int = 1,
+                 batch: bool = False, cache: bool = False, seed: int = None,
+                 min_parallel_pop: int = None, mp_start_method: str = None,
+                 selection: str = 'roulette', tournament_size: int = 3,
+                 patience: int = None, eps: float = 1e-8):
         ''' Population object: initializes a genetic algorithm population with
         user-specified population size, objective function and any additional
         immutable objects to pass to the objective function
@@ -24,6 +35,40 @@ class Population:
             objective_fn (callable): function for optimization
             obj_fn_args (dict): immutable arguments to pass to objective_fn
             num_processes (int): number of concurrent processes to utilize
+            batch (bool): if `True`, objective_fn is called once per
+                generation with a list of every member's parameter values and
+                must return a list of return values (one per member); a
+                single batch call replaces the process pool for evaluation,
+                which is usually faster for vectorized (e.g. NumPy)
+                objective functions (islands are still processed
+                concurrently)
+            cache (bool): if `True`, objective_fn return values are cached by
+                parameter values, and previously-evaluated parameter values
+                are not evaluated again
+            seed (int): seed for the population's random number generator,
+                used for all sampling, selection, crossover and mutation;
+                supply for reproducible results
+            min_parallel_pop (int): if `num_processes` > 1 and `pop_size` is
+                less than this, evaluations are performed in the current
+                process rather than by the process pool, as pool
+                communication can outweigh the evaluations themselves for
+                small populations; default of 2 * `num_processes`
+            mp_start_method (str): start method for worker processes, one of
+                `fork`, `spawn` or `forkserver` (see the `multiprocessing`
+                module); defaults to the platform's default start method
+            selection (str): method used to select members for the next
+                generation, `roulette` (fitness-proportionate, default) or
+                `tournament` (fittest of `tournament_size` random members)
+            tournament_size (int): number of members competing in each
+                tournament if `selection` is `tournament`; default of 3
+            patience (int): if supplied, the population is considered
+                converged once its best fitness score has changed by less
+                than `eps` over `patience` generations, after which
+                next_generation() has no effect (see `converged`); default of
+                `None`, convergence is not checked
+            eps (float): minimum change in best fitness score over `patience`
+                generations for the population to not be converged; default
+                of 1e-8
         '''
 
         if not callable(objective_fn):
@@ -32,12 +77,58 @@ class Population:
         if pop_size <= 1:
             raise ValueError('`pop_size` must be >= 2: {}'.format(pop_size))
 
+        if selection not in ('roulette', 'tournament'):
+            raise ValueError('`selection` must be `roulette` or `tournament`: '
+                             '{}'.format(selection))
+
+        if tournament_size < 1:
+            raise ValueError('`tournament_size` must be >= 1: {}'.format(
+                tournament_size
+            ))
+
+        if patience is not None and patience < 1:
+            raise ValueError('`patience` must be >= 1: {}'.format(patience))
+
         self._obj_fn = objective_fn
         self._obj_fn_args = obj_fn_args
+        self._bound_obj_fn = bind_obj_fn(objective_fn, obj_fn_args)
         self._pop_size = pop_size
         self._num_processes = num_processes
+        self._batch = batch
+        self._selection = selection
+        self._tournament_size = tournament_size
+        if min_parallel_pop is None:
+            min_parallel_pop = 2 * num_processes
+        self._min_parallel_pop = min_parallel_pop
+        self._mp_context = get_context(mp_start_method)
+        self._cache = {} if cache else None
+        self._cache_hits = 0
+        self._cache_misses = 0
         self._members = []
+        self._best = None
+        self._averages = None
         self._params = []
+        self._p_crossover = 0.5
+        self._p_mutation = 0.01
+        self._pool = None
+        self._pool_finalizer = None
+        self._rng = Random(seed)
+        self._eps = eps
+        self._best_history = None if patience is None else \
+            deque(maxlen=patience + 1)
+        self._converged = False
+
+    def __enter__(self):
+        ''' Population supports the context manager protocol; the process
+        pool is shut down when the `with` block exits
+        '''
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        ''' Shuts down the process pool (see Population.close) '''
+
+        self.close()
 
     @property
     def best_fitness(self) -> float:
@@ -45,7 +136,7 @@ class Population:
 
         if len(self._members) == 0:
             return None
-        return determine_best_member(self._members)[0]
+        return self._best_member()[0]
 
     @property
     def best_ret_val(self) -> Union[int, float]:
@@ -53,7 +144,7 @@ class Population:
 
         if len(self._members) == 0:
             return None
-        return determine_best_member(self._members)[1]
+        return self._best_member()[1]
 
     @property
     def best_params(self) -> list:
@@ -61,7 +152,7 @@ class Population:
 
         if len(self._members) == 0:
             return None
-        return determine_best_member(self._members)[2]
+        return self._best_member()[2]
 
     @property
     def average_fitness(self) -> float:
@@ -69,8 +160,7 @@ class Population:
 
         if len(self._members) == 0:
             return None
-        return (sum(m._fitness_score for m in self._members) /
-                len(self._members))
+        return self._average_vals()[0]
 
     @property
     def average_ret_val(self) -> float:
@@ -78,7 +168,30 @@ class Population:
 
         if len(self._members) == 0:
             return None
-        return (sum(m._obj_fn_val for m in self._members) / len(self._members))
+        return self._average_vals()[1]
+
+    @property
+    def converged(self) -> bool:
+        ''' Returns `True` if the population's best fitness score has changed
+        by less than `eps` over the last `patience` generations; always
+        `False` if `patience` was not supplied
+        '''
+
+        return self._converged
+
+    @property
+    def cache_info(self) -> dict:
+        ''' Returns objective_fn cache statistics: number of cache hits,
+        cache misses and cached parameter sets; None if caching is disabled
+        '''
+
+        if self._cache is None:
+            return None
+        return {
+            'hits': self._cache_hits,
+            'misses': self._cache_misses,
+            'size': len(self._cache)
+        }
 
     def add_param(self, min_val: Union[int, float], max_val: Union[int, float],
                   restrict: bool = True):
@@ -99,7 +212,52 @@ class Population:
                 'Cannot add another parameter after population is created'
             )
 
-        self._params.append(Parameter(min_val, max_val, restrict))
+        self._params.append(Parameter(min_val, max_val, restrict, self._rng))
+
+    def clear_cache(self):
+        ''' Population.clear_cache: removes all cached objective_fn return
+        values and resets cache statistics
+        '''
+
+        if self._cache is not None:
+            self._cache = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def close(self):
+        ''' Population.close: shuts down the process pool used for concurrent
+        processing, if one has been created; a new pool is created if the
+        population requires one again; if close() is not called, the pool is
+        terminated when the population is garbage collected
+        '''
+
+        if self._pool is not None:
+            self._pool_finalizer.detach()
+            self._pool_finalizer = None
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def set_rates(self, p_crossover: float = None, p_mutation: float = None):
+        ''' Population.set_rates: sets the crossover and mutation
+        probabilities used by next_generation() and evolve_islands() when
+        they are not supplied to those calls; rates are validated once here
+        rather than every generation
+
+        Args:
+            p_crossover (float): [0, 1], probability a member is subjected to
+                crossover after selection for the next generation; unchanged
+                if not supplied, initially 0.5 (50%)
+            p_mutation (float): [0, 1], probability a chosen member's
+                parameters are subject to mutation; unchanged if not
+                supplied, initially 0.01 (1%)
+        '''
+
+        self._check_rates(p_crossover, p_mutation)
+        if p_crossover is not None:
+            self._p_crossover = p_crossover
+        if p_mutation is not None:
+            self._p_mutation = p_mutation
 
     def initialize(self):
         ''' Population.initialize: generates random paramter values for each
@@ -115,49 +273,31 @@ class Population:
             warn('initialize() called again: overwriting current population',
                  RuntimeWarning)
 
-        self._members = []
-
-        if self._num_processes > 1:
-            mp_pool = Pool(processes=self._num_processes)
-        member_results = []
-
-        for _ in range(self._pop_size):
-
-            params = [p.rand_val for p in self._params]
-            if self._num_processes > 1:
-                member_results.append(mp_pool.apply_async(
-                    call_obj_fn, [params, self._obj_fn, self._obj_fn_args]
-                ))
-            else:
-                member_results.append(call_obj_fn(
-                    params, self._obj_fn, self._obj_fn_args
-                ))
-
-        if self._num_processes > 1:
-
-            mp_pool.close()
-            mp_pool.join()
-            member_results = [r.get() for r in member_results]
-
-        for result in member_results:
-
-            self._members.append(Member(result[0], result[1]))
+        # sample each parameter for every member at once, then transpose the
+        #   per-parameter columns into per-member rows
+        columns = [p.rand_vals(self._pop_size) for p in self._params]
+        self._set_members(
+            self._evaluate([list(row) for row in zip(*columns)])
+        )
+        self._reset_convergence()
 
-    def next_generation(self, p_crossover: float = 0.5,
-                        p_mutation: float = 0.01):
+    def next_generation(self, p_crossover: float = None,
+                        p_mutation: float = None):
         ''' Population.next_generation: generates the next generation of
         population members; members are chosen proportionally based on their
-        fitness, where a higher fitness results in a higher chance to be
-        chosen for the next generation; included is a chance for crossover
-        between two members and a chance for mutation within a member's
-        parameter/chromosome
+        fitness (or by tournament, see `selection`), where a higher fitness
+        results in a higher chance to be chosen for the next generation;
+        included is a chance for crossover between two members and a chance
+        for mutation within a member's parameter/chromosome; has no effect
+        once the population has converged (see `patience`)
 
         Args:
             p_crossover (float): [0, 1], probability a member is subjected to
-                crossover after selection for the next generation; default
-                value of 0.5 (50%)
+                crossover after selection for the next generation; defaults
+                to the rate set by set_rates(), initially 0.5 (50%)
             p_mutation (float): [0, 1], probability a chosen member's
-                parameters are subject to mutation; default value of 0.01 (1%)
+                parameters are subject to mutation; defaults to the rate set
+                by set_rates(), initially 0.01 (1%)
         '''
 
         if len(self._members) == 0:
@@ -165,66 +305,381 @@ class Population:
                 'initilize() must be called before next_generation()'
             )
 
-        if p_crossover < 0 or p_crossover > 1:
-            raise ValueError('`p_crossover` must be within [0, 1]: {}'.format(
-                p_crossover
-            ))
+        if p_crossover is None and p_mutation is None:
+            p_crossover, p_mutation = self._p_crossover, self._p_mutation
+        else:
+            self._check_rates(p_crossover, p_mutation)
+            if p_crossover is None:
+                p_crossover = self._p_crossover
+            if p_mutation is None:
+                p_mutation = self._p_mutation
 
-        if p_mutation < 0 or p_mutation > 1:
-            raise ValueError('`p_mutation` must be within [0, 1]: {}'.format(
-                p_mutation
-            ))
+        if self._converged:
+            return
 
         new_param_vals = []
-        cdf_vals = calc_cdf_vals(self._members)
 
-        while len(new_param_vals) < self._pop_size:
+        # draw every selected member index for the generation in one call;
+        #   each crossover consumes two slots, so not all draws are used
+        if self._selection == 'tournament':
+            cdf_vals = None
+            fitness_scores = [m._fitness_score for m in self._members]
+            ranked_idx = sorted(range(len(fitness_scores)),
+                                key=fitness_scores.__getitem__)
+            ranked_fitness = [fitness_scores[idx] for idx in ranked_idx]
+            member_ranks = [0] * len(ranked_idx)
+            for rank, idx in enumerate(ranked_idx):
+                member_ranks[idx] = rank
+            selected_idx = tournament_select(
+                ranked_idx, ranked_fitness, self._pop_size,
+                self._tournament_size, self._rng
+            )
+        else:
+            cdf_vals = calc_cdf_vals(self._members)
+            selected_idx = self._rng.choices(range(len(self._members)),
+                                             cum_weights=cdf_vals,
+                                             k=self._pop_size)
 
-            chosen_member = self._members[bisect(cdf_vals, random())]
+        for chosen_idx in selected_idx:
 
-            if len(self._params) > 1 and uniform(0, 1) < p_crossover:
+            if len(new_param_vals) >= self._pop_size:
+                break
 
-                mate = self._members[bisect(cdf_vals, random())]
-                while chosen_member == mate:
-                    mate = self._members[bisect(cdf_vals, random())]
+            chosen_member = self._members[chosen_idx]
+
+            if len(self._params) > 1 and self._rng.random() < p_crossover:
+
+                if cdf_vals is None:
+                    mate_idx = tournament_select_mate(
+                        ranked_idx, ranked_fitness, member_ranks[chosen_idx],
+                        self._tournament_size, self._rng
+                    )
+                else:
+                    mate_idx = select_mate(cdf_vals, chosen_idx, self._rng)
+                mate = self._members[mate_idx]
                 new_params_1, new_params_2 = perform_crossover(
-                    chosen_member._params, mate._params
+                    chosen_member._params, mate._params, self._rng
                 )
                 new_param_vals.append(mutate_params(
-                    new_params_1, self._params, p_mutation
+                    new_params_1, self._params, p_mutation, self._rng
                 ))
                 new_param_vals.append(mutate_params(
-                    new_params_2, self._params, p_mutation
+                    new_params_2, self._params, p_mutation, self._rng
                 ))
 
             else:
 
                 new_param_vals.append(mutate_params(
-                    chosen_member._params, self._params, p_mutation
+                    chosen_member._params, self._params, p_mutation, self._rng
                 ))
 
-        if self._num_processes > 1:
-            mp_pool = Pool(processes=self._num_processes)
-        new_member_results = []
+        self._set_members(self._evaluate(new_param_vals))
+        self._update_convergence()
+
+    def evolve_islands(self, num_islands: int, num_generations: int,
+                       migration_interval: int = 5, num_migrants: int = 1,
+                       p_crossover: float = None, p_mutation: float = None):
+        ''' Population.evolve_islands: splits the population into
+        `num_islands` sub-populations (islands) that evolve independently,
+        concurrently if `num_processes` > 1; every `migration_interval`
+        generations, each island's `num_migrants` best members replace the
+        worst members of the next island (ring topology); islands are merged
+        back into the population once `num_generations` generations have been
+        computed; island sizes are fixed, summing to the population size; the
+        objective function cache is not used by islands; has no effect once
+        the population has converged (see `patience`), and island generations
+        do not count toward `patience`: convergence tracking restarts from
+        the merged population
 
-        for vals in new_param_vals:
+        Args:
+            num_islands (int): number of sub-populations, each must contain at
+                least two members
+            num_generations (int): number of generations to compute
+            migration_interval (int): number of generations computed between
+                migrations; default value of 5
+            num_migrants (int): number of members migrating from each island;
+                default value of 1
+            p_crossover (float): [0, 1], probability a member is subjected to
+                crossover after selection for the next generation; defaults
+                to the rate set by set_rates(), initially 0.5 (50%)
+            p_mutation (float): [0, 1], probability a chosen member's
+                parameters are subject to mutation; defaults to the rate set
+                by set_rates(), initially 0.01 (1%)
+        '''
 
+        if len(self._members) == 0:
+            raise RuntimeError(
+                'initilize() must be called before evolve_islands()'
+            )
+
+        self._check_rates(p_crossover, p_mutation)
+        if p_crossover is None:
+            p_crossover = self._p_crossover
+        if p_mutation is None:
+            p_mutation = self._p_mutation
+
+        if num_islands < 1 or self._pop_size // num_islands < 2:
+            raise ValueError('Each island must contain at least two members: '
+                             '{} islands, {} members'.format(
+                                 num_islands, self._pop_size
+                             ))
+
+        if migration_interval < 1:
+            raise ValueError('`migration_interval` must be >= 1: {}'.format(
+                migration_interval
+            ))
+
+        if num_migrants < 0 or num_migrants >= (self._pop_size //
+                                                num_islands):
+            raise ValueError('`num_migrants` must be within [0, island size):'
+                             ' {}'.format(num_migrants))
+
+        if self._converged:
+            return
+
+        # the remainder of pop_size / num_islands is spread across the first
+        #   islands; members in excess of pop_size (a generation's final
+        #   crossover may add one) are dropped
+        island_sizes = [self._pop_size // num_islands +
+                        (1 if i < self._pop_size % num_islands else 0)
+                        for i in range(num_islands)]
+        islands = [self._members[i::num_islands][:island_sizes[i]]
+                   for i in range(num_islands)]
+        generation = 0
+
+        while generation < num_generations:
+
+            num_gens = min(migration_interval, num_generations - generation)
+            args = [(island, island_size, self._params, self._obj_fn,
+                     self._obj_fn_args, self._batch, self._selection,
+                     self._tournament_size, num_gens, p_crossover, p_mutation,
+                     self._rng.getrandbits(64))
+                    for island, island_size in zip(islands, island_sizes)]
             if self._num_processes > 1:
-                new_member_results.append(mp_pool.apply_async(
-                    call_obj_fn, [vals, self._obj_fn, self._obj_fn_args]
-                ))
+                islands = self._get_pool().starmap(_evolve_island, args)
             else:
-                new_member_results.append(call_obj_fn(
-                    vals, self._obj_fn, self._obj_fn_args
-                ))
+                islands = [_evolve_island(*a) for a in args]
+            generation += num_gens
+
+            if generation < num_generations and num_migrants > 0:
+                migrants = [nlargest(num_migrants, island,
+                                     key=attrgetter('_fitness_score'))
+                            for island in islands]
+                for idx, island in enumerate(islands):
+                    worst = nsmallest(
+                        num_migrants, range(len(island)),
+                        key=lambda i: island[i]._fitness_score
+                    )
+                    for island_idx, migrant in zip(worst, migrants[idx - 1]):
+                        island[island_idx] = migrant
+
+        self._set_members([m for island in islands for m in island])
+        self._reset_convergence()
+
+    def _best_member(self) -> tuple:
+        ''' Population._best_member: returns the fitness score, objective
+        function return value and parameters of the best-performing member;
+        determined once per generation, then cached
+
+        Returns:
+            tuple: (best fitness, best return value, best parameters)
+        '''
 
-        if self._num_processes > 1:
+        if self._best is None:
+            self._best = determine_best_member(self._members)
+        return self._best
 
-            mp_pool.close()
-            mp_pool.join()
-            new_member_results = [r.get() for r in new_member_results]
+    def _average_vals(self) -> tuple:
+        ''' Population._average_vals: returns the average fitness score and
+        average objective function return value of the population's members;
+        determined once per generation, then cached
 
-        self._members = []
-        for result in new_member_results:
+        Returns:
+            tuple: (average fitness, average return value)
+        '''
+
+        if self._averages is None:
+            self._averages = (
+                sum(m._fitness_score for m in self._members) /
+                len(self._members),
+                sum(m._obj_fn_val for m in self._members) / len(self._members)
+            )
+        return self._averages
+
+    def _check_rates(self, p_crossover: float, p_mutation: float):
+        ''' Population._check_rates: ensures supplied crossover and mutation
+        probabilities are within [0, 1]; rates that are None are not checked
+
+        Args:
+            p_crossover (float): probability of crossover, or None
+            p_mutation (float): probability of mutation, or None
+        '''
+
+        if p_crossover is not None and (p_crossover < 0 or p_crossover > 1):
+            raise ValueError('`p_crossover` must be within [0, 1]: {}'.format(
+                p_crossover
+            ))
+
+        if p_mutation is not None and (p_mutation < 0 or p_mutation > 1):
+            raise ValueError('`p_mutation` must be within [0, 1]: {}'.format(
+                p_mutation
+            ))
+
+    def _get_pool(self) -> Pool:
+        ''' Population._get_pool: returns the process pool used for concurrent
+        processing, creating it on first use; the pool is reused across
+        generations until Population.close() is called; the objective
+        function and its arguments are sent to each worker once, when the
+        worker starts
+
+        Returns:
+            multiprocessing.Pool: process pool with `num_processes` workers
+        '''
+
+        if self._pool is None:
+            self._pool = self._mp_context.Pool(
+                processes=self._num_processes, initializer=init_worker,
+                initargs=(self._obj_fn, self._obj_fn_args)
+            )
+            # terminate the pool's workers if the population is collected
+            #   without close() being called
+            self._pool_finalizer = finalize(self, self._pool.terminate)
+        return self._pool
+
+    def _evaluate(self, param_vals: list) -> list:
+        ''' Population._evaluate: evaluates the objective function for every
+        set of supplied parameter values; if caching is enabled, parameter
+        values already present in the cache are skipped and duplicate
+        parameter values within param_vals are evaluated only once
+
+        Args:
+            param_vals (list): list of parameter value lists, one per member
+
+        Returns:
+            list: list of pygenetics.Member objects, parallel to param_vals
+        '''
+
+        if self._cache is None:
+            return [Member(r[0], r[1]) for r in self._call_obj_fn(param_vals)]
+
+        keys = [tuple(vals) for vals in param_vals]
+        to_evaluate = {}
+        for vals, key in zip(param_vals, keys):
+            if key not in self._cache and key not in to_evaluate:
+                to_evaluate[key] = vals
+        for vals, ret_val in self._call_obj_fn(list(to_evaluate.values())):
+            self._cache[tuple(vals)] = ret_val
+        self._cache_misses += len(to_evaluate)
+        self._cache_hits += len(param_vals) - len(to_evaluate)
+        return [Member(vals, self._cache[key])
+                for vals, key in zip(param_vals, keys)]
+
+    def _set_members(self, members: list):
+        ''' Population._set_members: replaces the population's members,
+        invalidating statistics cached for the previous members
 
-            self._members.append(Member(result[0], result[1]))
+        Args:
+            members (list): list of pygenetics.Member objects
+        '''
+
+        self._members = members
+        self._best = None
+        self._averages = None
+
+    def _reset_convergence(self):
+        ''' Population._reset_convergence: discards the best fitness score
+        history, marking the population as not converged, and records the
+        current best fitness score
+        '''
+
+        self._converged = False
+        if self._best_history is not None:
+            self._best_history.clear()
+        self._update_convergence()
+
+    def _update_convergence(self):
+        ''' Population._update_convergence: if `patience` was supplied,
+        records the current best fitness score and marks the population as
+        converged if it has changed by less than `eps` over `patience`
+        generations
+        '''
+
+        if self._best_history is None:
+            return
+        self._best_history.append(self.best_fitness)
+        if len(self._best_history) == self._best_history.maxlen and \
+                max(self._best_history) - min(self._best_history) < \
+                self._eps:
+            self._converged = True
+
+    def _call_obj_fn(self, param_vals: list) -> list:
+        ''' Population._call_obj_fn: calls the objective function for every
+        set of supplied parameter values; all sets are collected up front and
+        passed to the objective function at once in batch mode, or dispatched
+        to a process pool in a single call if `num_processes` > 1 and the
+        population size is at least `min_parallel_pop`
+
+        Args:
+            param_vals (list): list of parameter value lists
+
+        Returns:
+            list: [(params, objective function return value), ...]
+        '''
+
+        if len(param_vals) == 0:
+            return []
+
+        if self._batch:
+            return call_batch_obj_fn(
+                param_vals, self._obj_fn, self._obj_fn_args
+            )
+
+        if self._num_processes > 1 and \
+                self._pop_size >= self._min_parallel_pop:
+            # one chunk per worker: O(num_processes) task messages per
+            #   generation instead of one per member
+            return self._get_pool().map(
+                call_worker_obj_fn, param_vals,
+                chunksize=ceil(len(param_vals) / self._num_processes)
+            )
+        return [(vals, self._bound_obj_fn(vals)) for vals in param_vals]
+
+
+def _evolve_island(members: list, island_size: int, params: list,
+                   objective_fn: Callable[[list], Union[int, float]],
+                   obj_fn_args: dict, batch: bool, selection: str,
+                   tournament_size: int, num_generations: int,
+                   p_crossover: float, p_mutation: float, seed: int) -> list:
+    ''' _evolve_island: evolves a sub-population (island) for a number of
+    generations; callable in single- and multi-processed configurations
+
+    Args:
+        members (list): list of pygenetics.Member objects on the island
+        island_size (int): number of members on the island; each generation
+            is trimmed to this size
+        params (list): list of pygenetics.Parameter objects
+        objective_fn (callable): function for optimization
+        obj_fn_args (dict): immutable arguments to pass to objective_fn
+        batch (bool): if `True`, objective_fn is evaluated in batch mode
+        selection (str): member selection method, `roulette` or `tournament`
+        tournament_size (int): number of members competing per tournament
+        num_generations (int): number of generations to compute
+        p_crossover (float): [0, 1], probability of crossover
+        p_mutation (float): [0, 1], probability of mutation
+        seed (int): seed for the island's random number generator
+
+    Returns:
+        list: list of pygenetics.Member objects on the island after evolving
+    '''
+
+    island = Population(island_size, objective_fn, obj_fn_args, batch=batch,
+                        seed=seed, selection=selection,
+                        tournament_size=tournament_size)
+    for p in params:
+        island.add_param(p._min_val, p._max_val, p._restrict)
+    island._members = members[:island_size]
+    island.set_rates(p_crossover, p_mutation)
+    for _ in range(num_generations):
+        island.next_generation()
+        island._set_members(island._members[:island_size])
+    return island._members
@@ -1,4 +1,32 @@
-from random import randint, uniform
+from bisect import bisect, bisect_left
+from functools import partial
+from itertools import accumulate
+from math import log, log1p
+from operator import attrgetter
+from random import Random, randint, random
+
+# objective function (bound to its arguments) of a worker process, see
+#   init_worker
+_worker_obj_fn = None
+
+
+def bind_obj_fn(obj_fn: callable, obj_fn_args: dict) -> callable:
+    ''' bind_obj_fn: binds non-tunable kwargs to the objective function once,
+    so that each call only supplies parameters; if there are no kwargs, the
+    objective function itself is returned and no kwargs are unpacked per call
+
+    Args:
+        obj_fn (callable): function to accept list of paramters, returns a
+            quantitative measurement of fitness
+        obj_fn_args (dict): non-tunable kwargs to pass to objective function
+
+    Returns:
+        callable: function accepting only a list of parameters
+    '''
+
+    if not obj_fn_args:
+        return obj_fn
+    return partial(obj_fn, **obj_fn_args)
 
 
 def calc_cdf_vals(members: list) -> list:
@@ -13,14 +41,32 @@ def calc_cdf_vals(members: list) -> list:
         list: CDF values w/ parallel indices to supplied Members
     '''
 
-    fitness_sum = sum(m._fitness_score for m in members)
-    selection_probs = [m._fitness_score / fitness_sum for m in members]
-    cdf_vals = []
-    cumsum = 0
-    for p in selection_probs:
-        cumsum += p
-        cdf_vals.append(cumsum)
-    return cdf_vals
+    cumsums = list(accumulate(m._fitness_score for m in members))
+    fitness_sum = cumsums[-1]
+    return [c / fitness_sum for c in cumsums]
+
+
+def call_batch_obj_fn(param_vals: list, obj_fn: callable,
+                      obj_fn_args: dict) -> list:
+    ''' call_batch_obj_fn: calls supplied objective function once, evaluating
+    every set of supplied parameters in a single call
+
+    Args:
+        param_vals (list): list of parameter value lists, one per member
+        obj_fn (callable): function to accept a list of parameter value
+            lists, returns a list of quantitative measurements of fitness
+        obj_fn_args (dict): non-tunable kwargs to pass to objective function
+
+    Returns:
+        list: [(params, objective function return value), ...]
+    '''
+
+    ret_vals = list(obj_fn(param_vals, **obj_fn_args))
+    if len(ret_vals) != len(param_vals):
+        raise ValueError('Batch objective function returned {} values for {} '
+                         'parameter sets'.format(len(ret_vals),
+                                                 len(param_vals)))
+    return list(zip(param_vals, ret_vals))
 
 
 def call_obj_fn(params: list, obj_fn: callable, obj_fn_args: dict) -> tuple:
@@ -41,6 +87,22 @@ def call_obj_fn(params: list, obj_fn: callable, obj_fn_args: dict) -> tuple:
     return (params, obj_fn(params, **obj_fn_args))
 
 
+def call_worker_obj_fn(params: list) -> tuple:
+    ''' call_worker_obj_fn: calls the objective function supplied to
+    init_worker, evaluating using supplied parameters; only the parameters are
+    sent to the worker process for each call
+
+    Args:
+        params (list): list of ints or floats corresponding to current member
+            parameter values
+
+    Returns:
+        tuple: (params, objective function return value)
+    '''
+
+    return (params, _worker_obj_fn(params))
+
+
 def determine_best_member(members: list) -> tuple:
     ''' determine_best_member: returns the fitness score, objective function
     return value, and paramters for the best-performing population member
@@ -52,18 +114,27 @@ def determine_best_member(members: list) -> tuple:
         tuple: (best fitness, best return value, best parameters)
     '''
 
-    best_fitness = members[0]._fitness_score
-    best_ret_val = members[0]._obj_fn_val
-    best_params = members[0]._params
-    for m in members[1:]:
-        if m._fitness_score > best_fitness:
-            best_fitness = m._fitness_score
-            best_ret_val = m._obj_fn_val
-            best_params = m._params
-    return (best_fitness, best_ret_val, best_params)
+    best = max(members, key=attrgetter('_fitness_score'))
+    return (best._fitness_score, best._obj_fn_val, best._params)
 
 
-def mutate_params(curr_params: list, params: list, p_mutation: float) -> list:
+def init_worker(obj_fn: callable, obj_fn_args: dict):
+    ''' init_worker: process pool initializer; stores the objective function
+    and its arguments in the worker process once, rather than sending them
+    with every call
+
+    Args:
+        obj_fn (callable): function to accept list of paramters, returns a
+            quantitative measurement of fitness
+        obj_fn_args (dict): non-tunable kwargs to pass to objective function
+    '''
+
+    global _worker_obj_fn
+    _worker_obj_fn = bind_obj_fn(obj_fn, obj_fn_args)
+
+
+def mutate_params(curr_params: list, params: list, p_mutation: float,
+                  rng: Random = None) -> list:
     ''' mutate_parameters: based on supplied mutation rate, mutates parameters
     supplied by the user
 
@@ -71,35 +142,176 @@ def mutate_params(curr_params: list, params: list, p_mutation: float) -> list:
         curr_params (list): current parameter values, int or float
         params (list): list of pygenetics.Parameter objects
         p_mutation (float): [0, 1], probability of mutation on any parameter
+        rng (random.Random): random number generator; if `None`, the `random`
+            module's shared generator is used
 
     Returns:
-        list: mutated parameters
+        list: mutated parameters; `curr_params` itself (not a copy) if no
+            parameter was mutated
     '''
 
-    new_params = []
-    for idx, param in enumerate(curr_params):
-        if uniform(0, 1) < p_mutation:
-            new_params.append(params[idx].mutate(param))
-        else:
-            new_params.append(param)
+    if p_mutation <= 0:
+        return curr_params
+
+    rand = random if rng is None else rng.random
+    # rather than drawing once per parameter, draw the number of parameters
+    #   skipped before the next mutation from a geometric distribution
+    log_keep = log1p(-p_mutation) if p_mutation < 1 else None
+    new_params = None
+    idx = -1
+    while True:
+        idx += 1
+        if log_keep is not None:
+            # compared as a float: for tiny p_mutation the skip may be too
+            #   large (or infinite) to convert to an int
+            skip = log(1.0 - rand()) / log_keep
+            if skip >= len(curr_params) - idx:
+                break
+            idx += int(skip)
+        if idx >= len(curr_params):
+            break
+        if new_params is None:
+            new_params = curr_params[:]
+        new_params[idx] = params[idx].mutate(curr_params[idx])
+    if new_params is None:
+        return curr_params
     return new_params
 
 
-def perform_crossover(params_1: list, params_2: list) -> tuple:
+def select_mate(cdf_vals: list, chosen_idx: int, rng: Random = None) -> int:
+    ''' select_mate: selects a population member proportionally to its
+    fitness, excluding an already-chosen member; a single draw is made over
+    the CDF with the chosen member's interval removed, rather than redrawing
+    until a different member is selected
+
+    Args:
+        cdf_vals (list): CDF values from calc_cdf_vals
+        chosen_idx (int): index of the already-chosen member
+        rng (random.Random): random number generator; if `None`, the `random`
+            module's shared generator is used
+
+    Returns:
+        int: index of the selected member
+    '''
+
+    rand = random if rng is None else rng.random
+    lower = cdf_vals[chosen_idx - 1] if chosen_idx > 0 else 0.0
+    width = cdf_vals[chosen_idx] - lower
+    draw = rand() * (1.0 - width)
+    if draw >= lower:
+        draw += width
+    return min(bisect(cdf_vals, draw), len(cdf_vals) - 1)
+
+
+def perform_crossover(params_1: list, params_2: list,
+                      rng: Random = None) -> tuple:
     ''' perform_crossover: performs a crossover of two parameter lists, using
     a random crossover point, and returns the resulting parameter lists
 
     Args:
         params_1 (list): first set of parameter values
         params_2 (list): second set of paramter values
+        rng (random.Random): random number generator; if `None`, the `random`
+            module's shared generator is used
 
     Returns:
         tuple: (crossed 1, crossed 2)
     '''
 
-    cross_pt = randint(1, len(params_1) - 1)
+    rand_int = randint if rng is None else rng.randint
+    cross_pt = rand_int(1, len(params_1) - 1)
     first_params = params_1[:cross_pt]
     first_params.extend(params_2[cross_pt:])
     second_params = params_2[:cross_pt]
     second_params.extend(params_1[cross_pt:])
     return (first_params, second_params)
+
+
+def tournament_select(ranked_idx: list, ranked_fitness: list,
+                      num_selected: int, tournament_size: int = 3,
+                      rng: Random = None) -> list:
+    ''' tournament_select: selects members via tournaments; each tournament
+    is between `tournament_size` members drawn uniformly (with replacement),
+    and the member with the highest fitness wins, ties broken uniformly; the
+    winner is drawn directly from its rank distribution, P(rank <= r) =
+    ((r + 1) / N) ^ tournament_size, then uniformly among members with the
+    same fitness
+
+    Args:
+        ranked_idx (list): member indices sorted by ascending fitness
+        ranked_fitness (list): fitness scores parallel to ranked_idx
+        num_selected (int): number of tournaments (selected members)
+        tournament_size (int): number of members competing per tournament
+        rng (random.Random): random number generator; if `None`, the `random`
+            module's shared generator is used
+
+    Returns:
+        list: indices of the selected members
+    '''
+
+    rand = random if rng is None else rng.random
+    num_members = len(ranked_idx)
+    exponent = 1 / tournament_size
+    return [ranked_idx[_pick_tied_rank(
+        ranked_fitness, int(num_members * rand() ** exponent), rand
+    )] for _ in range(num_selected)]
+
+
+def tournament_select_mate(ranked_idx: list, ranked_fitness: list,
+                           chosen_rank: int, tournament_size: int = 3,
+                           rng: Random = None) -> int:
+    ''' tournament_select_mate: selects a mate for an already-chosen member
+    via a tournament (see tournament_select); the chosen member does not
+    compete, so a member is never selected as its own mate
+
+    Args:
+        ranked_idx (list): member indices sorted by ascending fitness
+        ranked_fitness (list): fitness scores parallel to ranked_idx
+        chosen_rank (int): position of the already-chosen member in
+            ranked_idx
+        tournament_size (int): number of members competing in the tournament
+        rng (random.Random): random number generator; if `None`, the `random`
+            module's shared generator is used
+
+    Returns:
+        int: index of the selected member
+    '''
+
+    rand = random if rng is None else rng.random
+    # draw from every rank except chosen_rank: ranks at or above it are
+    #   shifted up by one
+    rank = int((len(ranked_idx) - 1) * rand() ** (1 / tournament_size))
+    if rank >= chosen_rank:
+        rank += 1
+    return ranked_idx[_pick_tied_rank(ranked_fitness, rank, rand, chosen_rank)]
+
+
+def _pick_tied_rank(ranked_fitness: list, rank: int, rand: callable,
+                    excluded_rank: int = None) -> int:
+    ''' _pick_tied_rank: returns a rank chosen uniformly from the ranks
+    whose fitness equals that of `rank`, so that tied members are equally
+    likely to win a tournament regardless of their order
+
+    Args:
+        ranked_fitness (list): fitness scores sorted in ascending order
+        rank (int): rank drawn for the tournament winner
+        rand (callable): function returning random floats in [0, 1)
+        excluded_rank (int): rank that may not be returned, if any
+
+    Returns:
+        int: rank of the tournament winner
+    '''
+
+    fitness = ranked_fitness[rank]
+    lower = bisect_left(ranked_fitness, fitness)
+    num_tied = bisect(ranked_fitness, fitness, lower) - lower
+    skip_excluded = excluded_rank is not None and \
+        lower <= excluded_rank < lower + num_tied
+    if skip_excluded:
+        num_tied -= 1
+    if num_tied == 1:
+        return rank
+    rank = lower + int(rand() * num_tied)
+    if skip_excluded and rank >= excluded_rank:
+        rank += 1
+    return rank
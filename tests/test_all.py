@@ -1,8 +1,14 @@
+import gc
+from multiprocessing.pool import TERMINATE
+from random import Random
+
 import pytest
 
 from pygenetics import Member, Parameter, Population
-from pygenetics.utils import calc_cdf_vals, call_obj_fn,\
-    determine_best_member, mutate_params, perform_crossover
+from pygenetics.utils import bind_obj_fn, calc_cdf_vals, call_batch_obj_fn,\
+    call_obj_fn, call_worker_obj_fn, determine_best_member, init_worker,\
+    mutate_params, perform_crossover, select_mate, tournament_select,\
+    tournament_select_mate
 
 
 # member.py
@@ -15,6 +21,7 @@ def test_member():
     assert m._fitness_score == 1.0
     assert m.calc_fitness(1.0) == 0.5
     assert m.calc_fitness(-1.0) == 2.0
+    assert not hasattr(m, '__dict__')
 
 
 # parameter.py
@@ -24,10 +31,15 @@ def test_param_init():
     p = Parameter(0, 10)
     assert p._min_val == 0
     assert p._max_val == 10
+    assert p._range == 10
     assert p._dtype == int
     assert p._restrict is True
+    assert p._small_int_range is False
     p = Parameter(0.0, 10.0)
     assert p._dtype == float
+    assert p._small_int_range is False
+    p = Parameter(0, 2)
+    assert p._small_int_range is True
     p = Parameter(0, 10, restrict=False)
     assert p._restrict is False
     with pytest.raises(ValueError):
@@ -44,6 +56,24 @@ def test_param_rand_val():
         assert rv <= 10.0
 
 
+def test_param_rand_vals():
+    p = Parameter(0, 10)
+    rvs = p.rand_vals(100)
+    assert len(rvs) == 100
+    for rv in rvs:
+        assert type(rv) == int
+        assert rv >= 0
+        assert rv <= 10
+    assert p.rand_vals(0) == []
+
+
+def test_param_rng():
+    p1 = Parameter(0.0, 10.0, rng=Random(1))
+    p2 = Parameter(0.0, 10.0, rng=Random(1))
+    assert p1.rand_vals(10) == p2.rand_vals(10)
+    assert p1.mutate(5.0) == p2.mutate(5.0)
+
+
 def test_param_mutate():
     p = Parameter(0.0, 10.0)
     curr_val = 5.0
@@ -74,6 +104,10 @@ def _objective_function_kwargs(params, my_kwarg):
     return sum(params) + my_kwarg
 
 
+def _objective_function_batch(param_sets):
+    return [sum(params) for params in param_sets]
+
+
 def test_pop_init():
     p = Population(10, _objective_function)
     assert p._pop_size == 10
@@ -83,6 +117,18 @@ def test_pop_init():
     assert p._obj_fn_args == kwargs
     p = Population(10, _objective_function, num_processes=8)
     assert p._num_processes == 8
+    assert p._min_parallel_pop == 16
+    p = Population(10, _objective_function, num_processes=8,
+                   min_parallel_pop=4)
+    assert p._min_parallel_pop == 4
+    assert p._batch is False
+    p = Population(10, _objective_function_batch, batch=True)
+    assert p._batch is True
+    assert p._selection == 'roulette'
+    p = Population(10, _objective_function, selection='tournament',
+                   tournament_size=4)
+    assert p._selection == 'tournament'
+    assert p._tournament_size == 4
 
 
 def test_pop_exceptions():
@@ -90,6 +136,11 @@ def test_pop_exceptions():
         p = Population(10, None)
     with pytest.raises(ValueError):
         p = Population(1, _objective_function)
+    with pytest.raises(ValueError):
+        p = Population(10, _objective_function, selection='rank')
+    with pytest.raises(ValueError):
+        p = Population(10, _objective_function, selection='tournament',
+                       tournament_size=0)
     p = Population(10, _objective_function)
     with pytest.raises(RuntimeError):
         p.initialize()
@@ -107,6 +158,12 @@ def test_pop_exceptions():
         p.next_generation(p_mutation=1.1)
     with pytest.raises(ValueError):
         p.next_generation(p_mutation=-0.1)
+    with pytest.raises(ValueError):
+        p.set_rates(p_crossover=1.1)
+    with pytest.raises(ValueError):
+        p.set_rates(p_mutation=-0.1)
+    with pytest.raises(ValueError):
+        p.evolve_islands(2, 1, p_mutation=1.1)
 
 
 def test_pop_no_stats():
@@ -143,6 +200,16 @@ def test_pop_initialize():
     p.add_param(0, 10)
     p.initialize()
     assert len(p._members) == 20
+    averages = p._average_vals()
+    assert p._average_vals() is averages
+    assert p.average_fitness == pytest.approx(
+        sum(m._fitness_score for m in p._members) / 20
+    )
+    assert p.average_ret_val == pytest.approx(
+        sum(m._obj_fn_val for m in p._members) / 20
+    )
+    p.next_generation()
+    assert p._average_vals() is not averages
 
 
 def test_pop_kwargs():
@@ -159,25 +226,245 @@ def test_pop_next_generation():
     p.add_param(0, 10)
     p.add_param(0, 10)
     p.initialize()
+    best = p._best_member()
+    assert p._best_member() is best
     for _ in range(10000):
         p.next_generation()
+    assert p._best_member() is not best
     assert p.best_fitness == 1
     assert p.best_ret_val == 0
     assert p.best_params == [0, 0, 0]
 
 
+def test_pop_tournament_selection():
+    p = Population(50, _objective_function, selection='tournament')
+    p.add_param(0, 10)
+    p.add_param(0, 10)
+    p.add_param(0, 10)
+    p.initialize()
+    for _ in range(500):
+        p.next_generation()
+    assert len(p._members) >= 50
+    assert p.best_ret_val == 0
+    p.evolve_islands(2, 4, migration_interval=2)
+    assert len(p._members) == 50
+
+
+def test_pop_convergence():
+    with pytest.raises(ValueError):
+        p = Population(10, _objective_function, patience=0)
+    p = Population(10, _objective_function)
+    assert p._best_history is None
+    p.add_param(0, 0)
+    p.add_param(0, 0)
+    p.initialize()
+    for _ in range(10):
+        p.next_generation()
+    assert p.converged is False
+    p = Population(10, _objective_function, patience=3)
+    p.add_param(0, 0)
+    p.add_param(0, 0)
+    p.initialize()
+    p.next_generation()
+    p.next_generation()
+    assert p.converged is False
+    p.next_generation()
+    assert p.converged is True
+    members = p._members
+    p.next_generation()
+    assert p._members is members
+    with pytest.raises(ValueError):
+        p.next_generation(p_crossover=1.1)
+    p.evolve_islands(2, 10)
+    assert p._members is members
+    with pytest.warns(RuntimeWarning):
+        p.initialize()
+    assert p.converged is False
+    assert len(p._best_history) == 1
+    p.next_generation()
+    assert len(p._best_history) == 2
+    p.evolve_islands(2, 10)
+    assert p.converged is False
+    assert len(p._best_history) == 1
+
+
+def test_pop_set_rates():
+    p = Population(10, _objective_function)
+    assert p._p_crossover == 0.5
+    assert p._p_mutation == 0.01
+    p.set_rates(p_crossover=0.8)
+    assert p._p_crossover == 0.8
+    assert p._p_mutation == 0.01
+    p.set_rates(p_mutation=0.2)
+    assert p._p_crossover == 0.8
+    assert p._p_mutation == 0.2
+    p.add_param(0, 10)
+    p.add_param(0, 10)
+    p.initialize()
+    p.set_rates(p_crossover=0.0, p_mutation=0.0)
+    params = sorted(m._params for m in p._members)
+    p.next_generation()
+    assert all(m._params in params for m in p._members)
+    p.next_generation(p_mutation=0.5)
+    assert p._p_mutation == 0.0
+
+
 def test_pop_multiprocessing():
     p = Population(10, _objective_function, num_processes=4)
     assert p._num_processes == 4
     p.add_param(0, 10)
     p.add_param(0, 10)
     p.initialize()
+    pool = p._pool
+    assert pool is not None
     p.next_generation()
+    assert p._pool is pool
+    p.close()
+    assert p._pool is None
+    p.next_generation()
+    assert p._pool is not None
+    p.close()
+    with pytest.raises(ValueError):
+        Population(10, _objective_function, mp_start_method='invalid')
+    with Population(10, _objective_function, num_processes=2,
+                    mp_start_method='spawn') as p:
+        p.add_param(0, 10)
+        p.add_param(0, 10)
+        p.initialize()
+        p.next_generation()
+        assert len(p._members) >= 10
+    with Population(10, _objective_function, num_processes=2) as p:
+        p.add_param(0, 10)
+        p.add_param(0, 10)
+        p.initialize()
+        assert p._pool is not None
+    assert p._pool is None
+    p = Population(4, _objective_function, num_processes=4)
+    p.add_param(0, 10)
+    p.add_param(0, 10)
+    p.initialize()
+    p.next_generation()
+    assert p._pool is None
+    p = Population(10, _objective_function, num_processes=2, cache=True)
+    p.add_param(2, 2)
+    p.add_param(2, 2)
+    p.initialize()
+    assert p.cache_info['misses'] == 1
+    assert p._pool is not None
+    p.close()
+    p = Population(10, _objective_function, num_processes=2)
+    p.add_param(0, 10)
+    p.add_param(0, 10)
+    p.initialize()
+    pool = p._pool
+    pool_finalizer = p._pool_finalizer
+    assert pool_finalizer.alive
+    del p
+    gc.collect()
+    assert not pool_finalizer.alive
+    assert pool._state == TERMINATE
+
+
+def test_pop_batch():
+    p = Population(10, _objective_function_batch, batch=True)
+    p.add_param(0, 10)
+    p.add_param(0, 10)
+    p.initialize()
+    assert len(p._members) == 10
+    for m in p._members:
+        assert m._obj_fn_val == sum(m._params)
+    p.next_generation()
+    assert len(p._members) >= 10
+
+
+def test_pop_cache():
+    p = Population(10, _objective_function)
+    assert p.cache_info is None
+    p = Population(10, _objective_function, cache=True)
+    assert p.cache_info == {'hits': 0, 'misses': 0, 'size': 0}
+    p.add_param(0, 10)
+    p.initialize()
+    misses = p.cache_info['misses']
+    assert misses == p.cache_info['size']
+    assert p.cache_info['hits'] + misses == 10
+    p.next_generation(p_mutation=0.0)
+    assert p.cache_info['misses'] == misses
+    assert p.cache_info['hits'] + misses == 20
+    assert p.cache_info['size'] == misses
+    for m in p._members:
+        assert m._obj_fn_val == sum(m._params)
+    p.clear_cache()
+    assert p.cache_info == {'hits': 0, 'misses': 0, 'size': 0}
+    p = Population(10, _objective_function, cache=True)
+    p.add_param(1, 1)
+    p.add_param(2, 2)
+    p.initialize()
+    assert p.cache_info == {'hits': 9, 'misses': 1, 'size': 1}
+    assert p.best_ret_val == 3
+
+
+def test_pop_evolve_islands():
+    p = Population(20, _objective_function, seed=0)
+    with pytest.raises(RuntimeError):
+        p.evolve_islands(2, 10)
+    p.add_param(0, 10)
+    p.add_param(0, 10)
+    p.add_param(0, 10)
+    p.initialize()
+    with pytest.raises(ValueError):
+        p.evolve_islands(11, 10)
+    with pytest.raises(ValueError):
+        p.evolve_islands(2, 10, migration_interval=0)
+    with pytest.raises(ValueError):
+        p.evolve_islands(2, 10, num_migrants=10)
+    p.evolve_islands(2, 100, migration_interval=10, num_migrants=2)
+    assert len(p._members) == 20
+    assert p.best_ret_val == 0
+    p = Population(10, _objective_function, num_processes=2)
+    p.add_param(0, 10)
+    p.add_param(0, 10)
+    p.initialize()
+    p.evolve_islands(2, 4, migration_interval=2)
+    assert len(p._members) == 10
+    p.close()
+    p = Population(21, _objective_function, seed=3)
+    p.add_param(0, 10)
+    p.add_param(0, 10)
+    p.add_param(0, 10)
+    p.initialize()
+    for _ in range(3):
+        p.evolve_islands(3, 20, migration_interval=1)
+        assert len(p._members) == 21
+        p.next_generation()
+    p.evolve_islands(4, 5)
+    assert len(p._members) == 21
+
+
+def test_pop_seed():
+    results = []
+    for _ in range(2):
+        p = Population(10, _objective_function, seed=42)
+        p.add_param(0, 10)
+        p.add_param(0.0, 10.0)
+        p.add_param(0, 10)
+        p.initialize()
+        for _ in range(5):
+            p.next_generation(p_mutation=0.1)
+        p.evolve_islands(2, 4, migration_interval=2)
+        assert len(p._members) == 10
+        results.append([m._params for m in p._members])
+    assert results[0] == results[1]
 
 
 # utils.py
 
 
+def test_utils_bind_obj_fn():
+    assert bind_obj_fn(_objective_function, {}) is _objective_function
+    fn = bind_obj_fn(_objective_function_kwargs, {'my_kwarg': 2})
+    assert fn([2, 2, 2]) == 8
+
+
 def test_utils_calc_cdf_vals():
     members = [
         Member([0, 0, 0], 1.0),
@@ -186,6 +473,7 @@ def test_utils_calc_cdf_vals():
     ]
     cdf_vals = calc_cdf_vals(members)
     assert len(cdf_vals) == 3
+    assert cdf_vals == sorted(cdf_vals)
     assert cdf_vals[2] == 1.0
 
 
@@ -200,6 +488,23 @@ def test_utils_call_obj_fn():
     assert param_vals == ret_params
 
 
+def test_utils_call_batch_obj_fn():
+    param_vals = [[1, 1, 1], [2, 2, 2]]
+    results = call_batch_obj_fn(param_vals, _objective_function_batch, {})
+    assert results == [([1, 1, 1], 3), ([2, 2, 2], 6)]
+    with pytest.raises(ValueError):
+        call_batch_obj_fn(param_vals, lambda p: [0], {})
+
+
+def test_utils_call_worker_obj_fn():
+    param_vals = [2, 2, 2]
+    init_worker(_objective_function_kwargs, {'my_kwarg': 2})
+    ret_params, result = call_worker_obj_fn(param_vals)
+    assert result == 8
+    assert param_vals == ret_params
+    init_worker(None, None)
+
+
 def test_utils_determine_best_member():
     members = [
             Member([0, 0, 0], 0.0),
@@ -221,8 +526,30 @@ def test_utils_mutate_params():
     ]
     new_vals = mutate_params(param_vals, params, 0.0)
     assert param_vals == new_vals
+    assert new_vals is param_vals
+    rng = Random(0)
+    state = rng.getstate()
+    mutate_params(param_vals, params, 0.0, rng)
+    assert rng.getstate() == state
     new_vals = mutate_params(param_vals, params, 1.0)
     assert param_vals != new_vals
+    assert param_vals == [5, 5, 5]
+    params = [Parameter(0, 10, rng=Random(0)) for _ in range(3)]
+    vals_1 = mutate_params(param_vals, params, 0.5, Random(0))
+    params = [Parameter(0, 10, rng=Random(0)) for _ in range(3)]
+    vals_2 = mutate_params(param_vals, params, 0.5, Random(0))
+    assert vals_1 == vals_2
+    param_vals = [5] * 1000
+    params = [Parameter(0, 10)] * 1000
+    new_vals = mutate_params(param_vals, params, 0.3)
+    num_mutated = sum(1 for v in new_vals if v != 5)
+    assert num_mutated > 200
+    assert num_mutated < 400
+    rng = Random(0)
+    for p_mutation in (1e-310, 5e-324):
+        for _ in range(100):
+            assert mutate_params(param_vals, params, p_mutation, rng) is \
+                param_vals
 
 
 def test_utils_perform_crossover():
@@ -244,3 +571,64 @@ def test_utils_perform_crossover():
     ]
     assert p1_new in possible_combos
     assert p2_new in possible_combos
+    assert perform_crossover(p1, p2, Random(0)) == \
+        perform_crossover(p1, p2, Random(0))
+
+
+def test_utils_select_mate():
+    cdf_vals = [0.5, 1.0]
+    for _ in range(100):
+        assert select_mate(cdf_vals, 0) == 1
+        assert select_mate(cdf_vals, 1) == 0
+    cdf_vals = [0.25, 0.5, 1.0]
+    counts = [0, 0, 0]
+    rng = Random(0)
+    for _ in range(3000):
+        counts[select_mate(cdf_vals, 1, rng)] += 1
+    assert counts[1] == 0
+    assert 800 < counts[0] < 1200
+    assert 1800 < counts[2] < 2200
+
+
+def test_utils_tournament_select():
+    ranked_idx = [0, 2, 1]
+    ranked_fitness = [0.1, 0.2, 1.0]
+    selected = tournament_select(ranked_idx, ranked_fitness, 1000, 3,
+                                 Random(0))
+    assert len(selected) == 1000
+    assert all(0 <= idx < 3 for idx in selected)
+    assert selected.count(1) > selected.count(2) > selected.count(0)
+    assert 650 < selected.count(1) < 750
+    assert tournament_select(ranked_idx, ranked_fitness, 10, 3, Random(1)) \
+        == tournament_select(ranked_idx, ranked_fitness, 10, 3, Random(1))
+    assert set(tournament_select(ranked_idx, ranked_fitness, 10, 1)) <= \
+        {0, 1, 2}
+    # tied members are equally likely to win, regardless of rank order
+    selected = tournament_select(list(range(10)), [0.5] * 10, 10000, 3,
+                                 Random(0))
+    assert all(900 < selected.count(idx) < 1100 for idx in range(10))
+    selected = tournament_select([0, 1, 2, 3], [0.1, 0.5, 0.5, 0.5], 9000,
+                                 3, Random(0))
+    assert all(2700 < selected.count(idx) < 3300 for idx in (1, 2, 3))
+
+
+def test_utils_tournament_select_mate():
+    ranked_idx = [0, 2, 1]
+    ranked_fitness = [0.1, 0.2, 1.0]
+    rng = Random(0)
+    for chosen_rank, chosen_idx in enumerate(ranked_idx):
+        mates = [tournament_select_mate(ranked_idx, ranked_fitness,
+                                        chosen_rank, 3, rng)
+                 for _ in range(100)]
+        assert chosen_idx not in mates
+        assert all(0 <= idx < 3 for idx in mates)
+    assert tournament_select_mate([0, 1], [0.1, 0.2], 0) == 1
+    assert tournament_select_mate([0, 1], [0.1, 0.2], 1, 1) == 0
+    ranked_fitness = [0.5] * 5
+    for chosen_rank in range(5):
+        mates = [tournament_select_mate(list(range(5)), ranked_fitness,
+                                        chosen_rank, 3, rng)
+                 for _ in range(4000)]
+        assert chosen_rank not in mates
+        assert all(800 < mates.count(idx) < 1200
+                   for idx in range(5) if idx != chosen_rank)